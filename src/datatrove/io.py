@@ -36,9 +36,11 @@ class OutputFileManager:
         Returns: a file handler we can write to
 
         """
-        if filename not in self._output_files:
-            self._output_files[filename] = self.fs.open(filename, mode=self.mode, compression=self.compression)
-        return self._output_files[filename]
+        # called for every single write: a single lookup on the hit path
+        file = self._output_files.get(filename)
+        if file is None:
+            file = self._output_files[filename] = self.fs.open(filename, mode=self.mode, compression=self.compression)
+        return file
 
     def get_open_files(self):
         """
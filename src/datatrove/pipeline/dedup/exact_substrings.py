@@ -15,23 +15,27 @@ TLDR
 """
 
 import struct
-from typing import BinaryIO, Generator
+from array import array
+from typing import TYPE_CHECKING, BinaryIO, Generator
 
 import numpy as np
-import tokenizers
 from loguru import logger
 
 from datatrove.io import DataFolderLike, get_datafolder
 from datatrove.pipeline.base import DocumentsPipeline, PipelineStep
+from datatrove.pipeline.tokens.tokenizer import batched
 
 from .utils import ExtensionHelperES as EH
 
 
+if TYPE_CHECKING:
+    from tokenizers import Tokenizer
+
+
 SEPARATOR_BYTES = 12
 
 
-def prepare_doc(tokenizer, doc: str, rank: int, doc_id: int):
-    tokens = tokenizer.encode(doc).ids
+def prepare_doc(tokens: list[int], rank: int, doc_id: int):
     tokens = np.fromiter(tokens, dtype=np.uint16, count=len(tokens))
     b_doc = b"\xff\xff" + struct.pack("<I", doc_id) + b"\xff\xff" + struct.pack("<I", rank) + tokens.tobytes()
     return b_doc
@@ -45,36 +49,51 @@ class ESDatasetToSequence(PipelineStep):
     Args:
         output_folder: folder where sequences are saved
         tokenizer_name: name of tokenizer as in HF tokenizers.
+        batch_size: number of documents to tokenize at once with encode_batch.
     """
 
     type = "🫂 - DEDUP"
     name = "🪞 - exact-substrings stage 1"
     _requires_dependencies = ["tokenizers"]
 
-    def __init__(self, output_folder: DataFolderLike, tokenizer_name: str = "gpt2"):
+    def __init__(self, output_folder: DataFolderLike, tokenizer_name: str = "gpt2", batch_size: int = 1000):
         super().__init__()
         self.output_folder = get_datafolder(output_folder)
-        self.tokenizer = tokenizers.Tokenizer.from_pretrained(tokenizer_name)
+        self.tokenizer_name = tokenizer_name
+        self.batch_size = batch_size
+        self._tokenizer = None
+
+    @property
+    def tokenizer(self) -> "Tokenizer":
+        if not self._tokenizer:
+            from tokenizers import Tokenizer
 
-    def save_sizes(self, doc_lens: list[int], rank: int):
+            self._tokenizer = Tokenizer.from_pretrained(self.tokenizer_name)
+        return self._tokenizer
+
+    def save_sizes(self, doc_lens: array, rank: int):
         """Saves the byte sizes of each doc in a file.
 
         Args:
-            doc_lens: list of sizes of each doc
+            doc_lens: array of uint64 sizes of each doc
             rank: rank of the process
         """
         with self.output_folder.open(f"{rank:05d}{EH.stage_1_sequence_size}", mode="wb") as f_lens:
-            f_lens.write(struct.pack("Q" * len(doc_lens), *doc_lens))
+            f_lens.write(doc_lens.tobytes())
 
     def run(self, data: DocumentsPipeline, rank: int = 0, world_size: int = 1):
-        doc_lens = []
+        # compact uint64 buffer: 8 bytes per doc instead of a python int + list slot
+        doc_lens = array("Q")
         with self.output_folder.open(f"{rank:05d}{EH.stage_1_sequence}", mode="wb") as f_sequence:
             i = -1
-            for i, doc in enumerate(data):
-                with self.stats.time_stats:
-                    b_doc = prepare_doc(tokenizer=self.tokenizer, doc=doc.text, rank=rank, doc_id=i)
-                    doc_lens.append(len(b_doc))
-                    f_sequence.write(b_doc)
+            for batch in batched(data, self.batch_size):
+                with self.track_time(unit="batch"):
+                    encoded_batch = self.tokenizer.encode_batch([doc.text for doc in batch])
+                    for encoded in encoded_batch:
+                        i += 1
+                        b_doc = prepare_doc(tokens=encoded.ids, rank=rank, doc_id=i)
+                        doc_lens.append(len(b_doc))
+                        f_sequence.write(b_doc)
 
         assert i < 2**32, "doc ID overflow"
         assert i + 1 == len(doc_lens), f"{i=} but {len(doc_lens)=}"
@@ -160,7 +179,8 @@ class ESRangeRemover(PipelineStep):
     ):
         super().__init__()
         self.sequence_folder = get_datafolder(sequence_folder)
-        self.tokenizer = tokenizers.Tokenizer.from_pretrained(tokenizer_name)
+        self.tokenizer_name = tokenizer_name
+        self._tokenizer = None
         self.min_doc_words = min_doc_words
         self.sequence_bytes_offset = None
         self.dup_ranges = None
@@ -170,6 +190,14 @@ class ESRangeRemover(PipelineStep):
         self.range_idx = 0
         self.language = language
 
+    @property
+    def tokenizer(self) -> "Tokenizer":
+        if not self._tokenizer:
+            from tokenizers import Tokenizer
+
+            self._tokenizer = Tokenizer.from_pretrained(self.tokenizer_name)
+        return self._tokenizer
+
     def reset(self):
         self.bytes_counter = 0
         self.range_idx = 0
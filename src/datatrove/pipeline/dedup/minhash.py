@@ -71,7 +71,7 @@ class MinhashConfig:
 DEFAULT_MINHASH_CONFIG = MinhashConfig()
 
 
-@dataclass(order=True)
+@dataclass(order=True, slots=True)
 class HashSig:
     """Hash signature for a given document in a given bucket
 
@@ -473,10 +473,12 @@ class MinhashDedupCluster(PipelineStep):
         union_set = {}
 
         def parent(x):
-            if x not in union_set or union_set[x] == x:
+            # single dict lookup on the hot path: nodes not in union_set are their own parent
+            p = union_set.get(x, x)
+            if p == x:
                 return x
-            union_set[x] = parent(union_set[x])
-            return union_set[x]
+            root = union_set[x] = parent(p)
+            return root
 
         with self.track_time():
             for dup_file in dup_files:
@@ -25,7 +25,7 @@ from ..writers.disk_base import DiskWriter
 from .utils import ExtensionHelperSD, merge_docs, read_tuples_from_file, simplify_text, str_hash
 
 
-@dataclass(order=True)
+@dataclass(order=True, slots=True)
 class HashSig:
     # this also determines the sorting order
     # hash_value needs to come first as that's what we match on
@@ -229,20 +229,26 @@ class SentenceDedupFilter(PipelineStep):
         exclusion_writer: DiskWriter = None,
         language: str = "english",
     ):
-        from nltk import load
-
         super().__init__()
         self.data_folder = get_datafolder(data_folder)
         self.n_sentences = n_sentences
         self.min_doc_words = min_doc_words
-        self._tokenizer = load(f"tokenizers/punkt/{language}.pickle")
+        self._tokenizer = None
         self.exclusion_writer = exclusion_writer
         self.language = language
 
+    @property
+    def tokenizer(self):
+        if not self._tokenizer:
+            from nltk import load
+
+            self._tokenizer = load(f"tokenizers/punkt/{self.language}.pickle")
+        return self._tokenizer
+
     def remove_dup_sentences(self, doc: Document, du_lines: set = None) -> tuple[str, str]:
         if not du_lines:
             return doc.text, None
-        sentence_spans = list(self._tokenizer.span_tokenize(doc.text))
+        sentence_spans = list(self.tokenizer.span_tokenize(doc.text))
         kept_sentences = []
         original_formatted = []
         last_s = 0
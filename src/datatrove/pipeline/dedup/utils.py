@@ -26,6 +26,9 @@ class ExtensionHelperES:
 PUNCTUATION = "!/—”:％１〈&(、━\\【#%「」，】；+^]~“《„';’{|∶´[=-`*．（–？！：$～«〉,><》)?）。…@_.\"}►»" + "".join(
     map(chr, list(range(0, 32)) + list(range(127, 160)))
 )
+# translation table deleting PUNCTUATION, built once instead of on every simplify_text call
+PUNCTUATION_TRANS = str.maketrans("", "", PUNCTUATION)
+WHITESPACE = re.compile(r"\s+")
 
 
 def read_tuples_from_file(file: BinaryIO, *formats):
@@ -59,10 +62,11 @@ def simplify_text(text: str) -> str:
     """
     # lower case
     text = text.lower()
-    # remove consecutive spaces, newlines, tabs in the middle and in the beginning / end
-    text = re.sub(r"\s+", " ", text.strip())
+    # remove consecutive spaces, newlines, tabs. leading/trailing whitespace is left as a single " " that the final
+    # strip() removes, so the text does not need to be stripped (copied) twice
+    text = WHITESPACE.sub(" ", text)
     # remove punctuation
-    text = text.translate(str.maketrans("", "", PUNCTUATION))
+    text = text.translate(PUNCTUATION_TRANS)
     # diacritics/unicode normalization
     text = "".join(c for c in unicodedata.normalize("NFD", text) if unicodedata.category(c) != "Mn")
     return text.strip()
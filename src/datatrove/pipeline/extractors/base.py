@@ -22,6 +22,7 @@ class BaseExtractor(PipelineStep):
         """
         super().__init__()
         self.timeout = timeout
+        self._timeout_warning = False
 
     @abstractmethod
     def extract(self, text: str) -> str:
@@ -55,7 +56,11 @@ class BaseExtractor(PipelineStep):
             return self.extract(doc.text)
 
         except TimeoutError:
-            logger.warning("⏰ Timeout while cleaning record text. Skipping record.")
+            # the message is always the same: only log it once, the count is kept in the stats
+            self.stat_update("timeout")
+            if not self._timeout_warning:
+                self._timeout_warning = True
+                logger.warning("⏰ Timeout while cleaning record text. Skipping record. (only logged once)")
 
         except Exception as e:
             logger.warning(f'❌ Error "{e}" while cleaning record text. Skipping record.')
@@ -21,8 +21,6 @@ class C4QualityFilter(BaseFilter):
     _requires_dependencies = ["nltk"]
 
     def __init__(self, exclusion_writer: DiskWriter = None):
-        from nltk import load
-
         super().__init__(exclusion_writer)
 
         self.lorem_ipsum = re.compile(r"(?i)lorem ipsum")
@@ -30,7 +28,15 @@ class C4QualityFilter(BaseFilter):
         self.min_lines = 5
         self.min_words = 3
         self.stop_chars = (".", "'", '"', "!", "?")
-        self._tokenizer = load("tokenizers/punkt/english.pickle")
+        self._tokenizer = None
+
+    @property
+    def tokenizer(self):
+        if not self._tokenizer:
+            from nltk import load
+
+            self._tokenizer = load("tokenizers/punkt/english.pickle")
+        return self._tokenizer
 
     def line_filter(self, line: str):
         if self.javascript.search(line):
@@ -47,9 +53,7 @@ class C4QualityFilter(BaseFilter):
         Returns:
 
         """
-        from nltk.tokenize import sent_tokenize
-
-        lines = sent_tokenize(doc.text)
+        lines = self.tokenizer.tokenize(doc.text)
         if len(lines) < self.min_lines:
             return False, f"< {self.min_lines} lines"
 
@@ -85,10 +89,7 @@ class C4ParagraphFilter(BaseFilter):
         lines = page.split(self.line_delimiter)
         # Filter out docs that don't have at least three "paragraphs"
         # (lines >= `min_paragraph_len` chars).
-        if (
-            len(lines) < self.min_paragraphs
-            or min(heapq.nlargest(3, [len(line) for line in lines])) < self.min_paragraph_len
-        ):
+        if len(lines) < self.min_paragraphs or min(heapq.nlargest(3, map(len, lines))) < self.min_paragraph_len:
             return False
         return True
 
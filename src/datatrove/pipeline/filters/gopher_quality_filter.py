@@ -1,13 +1,13 @@
 import string
 
-import numpy as np
-
 from datatrove.data import Document
 from datatrove.pipeline.filters.base_filter import BaseFilter
 from datatrove.pipeline.writers.disk_base import DiskWriter
+from datatrove.utils.word_tokenizers import word_tokenize
 
 
 STOP_WORDS = ["the", "be", "to", "of", "and", "that", "have", "with"]
+PUNCTUATION = frozenset(string.punctuation)
 
 
 class GopherQualityFilter(BaseFilter):
@@ -67,20 +67,20 @@ class GopherQualityFilter(BaseFilter):
         Returns: False if sample.text does not pass any of the the heuristic tests
 
         """
-        from nltk.tokenize import word_tokenize
-
         text = doc.text
         words = word_tokenize(text)  # TODO we should use language id filter
 
         # words < min_doc_words or words > max_doc_words
-        n_words = len([w for w in words if w not in string.punctuation])
-        if self.min_doc_words and n_words < self.min_doc_words:
+        non_symbol_words = [w for w in words if w not in PUNCTUATION]
+        n_words = len(non_symbol_words)
+        # the ratios below are all relative to n_words
+        if n_words == 0 or (self.min_doc_words and n_words < self.min_doc_words):
             return False, "gopher_short_doc"
         if self.max_doc_words and n_words > self.max_doc_words:
             return False, "gopher_long_doc"
 
         # mean word length is outside the range of 3 to 10 characters
-        avg_n_words = np.mean([len(w) for w in words if w not in string.punctuation])
+        avg_n_words = sum(map(len, non_symbol_words)) / n_words
         if self.min_avg_word_length and avg_n_words < self.min_avg_word_length:
             return False, "gopher_below_avg_threshold"
         if self.max_avg_word_length and avg_n_words > self.max_avg_word_length:
@@ -94,24 +94,23 @@ class GopherQualityFilter(BaseFilter):
 
         # any document with more than 90 % of lines starting with a bullet point,
         # or more than 30 % ending with an ellipsis.
+        # both counts are gathered in a single pass over the lines
         lines = text.splitlines()
-        if (
-            self.max_bullet_lines_ratio
-            and sum(s.lstrip().startswith("•") or s.lstrip().startswith("-") for s in lines) / len(lines)
-            > self.max_bullet_lines_ratio
-        ):
+        bullet_lines = ellipsis_lines = 0
+        for line in lines:
+            if line.lstrip().startswith(("•", "-")):
+                bullet_lines += 1
+            if line.rstrip().endswith(("...", "…")):
+                ellipsis_lines += 1
+        if self.max_bullet_lines_ratio and bullet_lines / len(lines) > self.max_bullet_lines_ratio:
             return False, "gopher_too_many_bullets"
-        if (
-            self.max_ellipsis_lines_ratio
-            and sum(s.rstrip().endswith("...") or s.rstrip().endswith("…") for s in lines) / len(lines)
-            > self.max_ellipsis_lines_ratio
-        ):
+        if self.max_ellipsis_lines_ratio and ellipsis_lines / len(lines) > self.max_ellipsis_lines_ratio:
             return False, "gopher_too_many_end_ellipsis"
 
         # that 80 % of words in a document contain at least one alphabetic character
         if (
             self.max_non_alpha_words_ratio
-            and sum([any((c.isalpha() for c in w)) for w in words]) / n_words < self.max_non_alpha_words_ratio
+            and sum(1 for w in words if any(map(str.isalpha, w))) / n_words < self.max_non_alpha_words_ratio
         ):
             return False, "gopher_below_alpha_threshold"
 
@@ -4,6 +4,7 @@ from collections import Counter
 from datatrove.data import Document
 from datatrove.pipeline.filters.base_filter import BaseFilter
 from datatrove.pipeline.writers.disk_base import DiskWriter
+from datatrove.utils.word_tokenizers import word_tokenize
 
 
 """
@@ -45,9 +46,7 @@ def find_duplicates(x: list[str]) -> tuple[int, int]:
 
 
 def find_top_duplicate(x: list[str]) -> int:
-    counter = Counter()
-    for element in x:
-        counter[element] += 1
+    counter = Counter(x)
     top_n_gram = counter.most_common(1)[0]
     return len(top_n_gram[0]) * top_n_gram[1]
 
@@ -104,9 +103,10 @@ class GopherRepetitionFilter(BaseFilter):
         self.paragraph_exp = re.compile(r"\n{2,}")
 
     def filter(self, doc: Document) -> bool | tuple[bool, str]:
-        from nltk.tokenize import word_tokenize
-
         text = doc.text
+        # all the character fractions below are relative to len(text). an empty document has nothing repeated
+        if not text:
+            return True
 
         paragraphs = self.paragraph_exp.split(text.strip())
         paragraphs_duplicates, char_duplicates = find_duplicates(paragraphs)
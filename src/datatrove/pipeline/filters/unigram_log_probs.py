@@ -9,6 +9,7 @@ from loguru import logger
 from datatrove.data import Document
 from datatrove.pipeline.filters.base_filter import BaseFilter
 from datatrove.pipeline.writers.disk_base import DiskWriter
+from datatrove.utils.word_tokenizers import word_tokenize
 
 
 UNIGRAM_DOWNLOAD = "https://ai2-s2-research-public.s3-us-west-2.amazonaws.com/lucas/google-1T-unigram/unigram_freq.csv"
@@ -38,7 +39,14 @@ class UnigramLogProbFilter(BaseFilter):
         """
         super().__init__(exclusion_writer)
         self.logprobs_threshold = logprobs_threshold
-        self.unigram_frequencies = self.get_frequencies()
+        self._unigram_frequencies = None
+
+    @property
+    def unigram_frequencies(self) -> dict[str, float]:
+        # loaded on first use in each worker so the (large) table is not pickled along with the pipeline
+        if not self._unigram_frequencies:
+            self._unigram_frequencies = self.get_frequencies()
+        return self._unigram_frequencies
 
     def get_frequencies(self):
         download_dir = cached_assets_path(
@@ -60,14 +68,14 @@ class UnigramLogProbFilter(BaseFilter):
         return {word: count / total_count for word, count in zip(words, counts)}
 
     def get_logprob(self, doc):
-        from nltk.tokenize import word_tokenize
-
         words = word_tokenize(doc.text)
-        freqs = [self.unigram_frequencies.get(word.lower(), 1e-9) for word in words]
+        unigram_frequencies = self.unigram_frequencies
+        freqs = [unigram_frequencies.get(word, 1e-9) for word in map(str.lower, words)]
 
         if len(freqs) == 0:
             return 0
-        return sum([np.log(f) for f in freqs]) / len(freqs)
+        # a single vectorized log over the whole document instead of one numpy call per word
+        return np.log(freqs).mean()
 
     def filter(self, doc: Document) -> bool:
         """
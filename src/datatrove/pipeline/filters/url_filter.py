@@ -99,11 +99,12 @@ class URLFilter(BaseFilter):
         if url in self.block_listed_url:
             return False, "url"
 
+        # set operations iterate over the (few) url words instead of over every word of the lists
         url_words = set(normalizer.split(url))
-        if any(word in url_words for word in self.banned_words):
+        if not self.banned_words.isdisjoint(url_words):
             return False, "hard_blacklisted"
 
-        nb_soft_words = sum([word in url_words for word in self.soft_banned_words])
+        nb_soft_words = len(self.soft_banned_words & url_words)
         if nb_soft_words >= self.soft_word_threshold:
             return False, "soft_blacklisted"
 
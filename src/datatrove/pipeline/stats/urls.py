@@ -1,7 +1,10 @@
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from datatrove.io import DataFolderLike, get_datafolder
 from datatrove.pipeline.base import DocumentsPipeline, PipelineStep
+from datatrove.utils._import_utils import is_orjson_available, load_json
 from datatrove.utils.stats import MetricStatsDict
 
 
@@ -15,6 +18,10 @@ class URLStats(PipelineStep):
         input_folder: the input folder to read the statistics from (default: None). Used to merge statistics
         topk: the number of top URLs to keep (default: None - keep all)
         min_doc_count_to_save: the minimum number of documents per URL to save the URL (default: 1)
+        read_workers: the number of threads used to read the statistics files when merging (default: 8)
+        max_urls_in_memory: if set, bounds the per rank statistics to at most 2 * max_urls_in_memory URLs: once the
+            counter grows past that, it is pruned back to the max_urls_in_memory most frequent URLs. Counts of dropped
+            URLs are lost (default: None - keep all)
     """
 
     type = "📊 - STATS"
@@ -28,6 +35,8 @@ class URLStats(PipelineStep):
         input_folder: DataFolderLike = None,
         topk: int = None,
         min_doc_count_to_save: int = 1,
+        read_workers: int = 8,
+        max_urls_in_memory: int = None,
     ):
         super().__init__()
         self.url_field = url_field
@@ -35,6 +44,25 @@ class URLStats(PipelineStep):
         self.input_folder = get_datafolder(input_folder) if input_folder else None
         self.topk = topk
         self.min_doc_count_to_save = min_doc_count_to_save
+        self.read_workers = read_workers
+        self.max_urls_in_memory = max_urls_in_memory
+
+    def _load_stats_file(self, file: str) -> dict:
+        with self.input_folder.open(file, "rb") as f:
+            return load_json(f)
+
+    def _read_stats_files(self):
+        """Yields the parsed content of each statistics file in input_folder, in order.
+        Files are read by a pool of threads, but only up to 2 * read_workers parsed files are kept in memory at once.
+        """
+        with ThreadPoolExecutor(max_workers=self.read_workers) as pool:
+            pending = deque()
+            for file in self.input_folder.list_files(glob_pattern="json"):
+                pending.append(pool.submit(self._load_stats_file, file))
+                if len(pending) >= 2 * self.read_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
 
     def run(self, data: DocumentsPipeline, rank: int = 0, world_size: int = 1) -> DocumentsPipeline:
         doc_counter = MetricStatsDict()
@@ -44,13 +72,12 @@ class URLStats(PipelineStep):
         if self.input_folder:
             # reduce the map results
             assert world_size == 1, "world_size must be 1 when getting the input from an input_folder"
-            for file in self.input_folder.list_files(glob_pattern="json"):
-                with self.input_folder.open(file, "rt") as f:
-                    file_data = json.load(f)
-                    doc_counter += MetricStatsDict(init=file_data["doc_counter"])
-                    tokens_counter += MetricStatsDict(init=file_data["tokens_counter"])
-                    total_docs += file_data["total_docs"]
-                    total_tokens += file_data["total_tokens"]
+            # reading/parsing is I/O bound and independent per file: overlap it, merge serially
+            for file_data in self._read_stats_files():
+                doc_counter += MetricStatsDict(init=file_data["doc_counter"])
+                tokens_counter += MetricStatsDict(init=file_data["tokens_counter"])
+                total_docs += file_data["total_docs"]
+                total_tokens += file_data["total_tokens"]
             if self.topk:
                 doc_counter = doc_counter.topk(self.topk)
                 tokens_counter = tokens_counter.topk(self.topk)
@@ -65,6 +92,11 @@ class URLStats(PipelineStep):
                 if token_count := doc.metadata.get("token_count", None):
                     tokens_counter[url] += token_count
                     total_tokens += token_count
+                if self.max_urls_in_memory and len(doc_counter) > 2 * self.max_urls_in_memory:
+                    doc_counter = doc_counter.topk(self.max_urls_in_memory)
+                    tokens_counter = MetricStatsDict(
+                        init={url: tokens_counter[url] for url in doc_counter if url in tokens_counter}
+                    )
                 yield doc
         # save to disk
         if self.min_doc_count_to_save > 0:
@@ -73,15 +105,19 @@ class URLStats(PipelineStep):
                     del doc_counter[url]
                     if url in tokens_counter:
                         del tokens_counter[url]
-        with self.output_folder.open(
-            f"{rank:05d}_url_stats.json" if not self.input_folder else "url_stats.json", "wt"
-        ) as f:
-            json.dump(
-                {
-                    "total_docs": total_docs,
-                    "total_tokens": total_tokens,
-                    "doc_counter": doc_counter.to_dict(),
-                    "tokens_counter": tokens_counter.to_dict(),
-                },
-                f,
-            )
+        output_filename = f"{rank:05d}_url_stats.json" if not self.input_folder else "url_stats.json"
+        url_stats = {
+            "total_docs": total_docs,
+            "total_tokens": total_tokens,
+            "doc_counter": doc_counter.to_dict(),
+            "tokens_counter": tokens_counter.to_dict(),
+        }
+        if is_orjson_available():
+            import orjson
+
+            # much faster than the stdlib encoder on counters with many string keys
+            with self.output_folder.open(output_filename, "wb") as f:
+                f.write(orjson.dumps(url_stats))
+        else:
+            with self.output_folder.open(output_filename, "wt") as f:
+                json.dump(url_stats, f)
@@ -1,11 +1,11 @@
 import argparse
-import json
 import os.path
 
 from loguru import logger
 from tqdm import tqdm
 
 from datatrove.io import get_datafolder, open_file
+from datatrove.utils._import_utils import load_json
 from datatrove.utils.stats import PipelineStats
 
 
@@ -29,11 +29,11 @@ def main():
     # output file
     path = args.output
 
-    stats = []
+    # merge each file as it is read instead of keeping every task's stats in memory
+    merged = PipelineStats()
     for file in tqdm(stats_folder.list_files()):
-        with stats_folder.open(file, "rt") as f:
-            stats.append(PipelineStats.from_json(json.load(f)))
-    merged = sum(tqdm(stats), start=PipelineStats())
+        with stats_folder.open(file, "rb") as f:
+            merged += PipelineStats.from_json(load_json(f))
     with open_file(path, mode="wt") as f:
         merged.save_to_disk(f)
     logger.info(f"Processing complete. Results saved to {path}.")
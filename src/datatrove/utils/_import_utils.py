@@ -1,6 +1,8 @@
 import importlib.resources
+import json
 import os
 from functools import lru_cache
+from typing import IO, Any
 
 
 ASSETS_PATH = os.path.join(importlib.resources.files(__package__.split(".")[0]), "assets")
@@ -31,6 +33,26 @@ def is_tokenizers_available():
     return _is_package_available("tokenizers")
 
 
+def is_orjson_available():
+    return _is_package_available("orjson")
+
+
+def load_json(file: IO[bytes]) -> Any:
+    """
+        Parses a json file opened in binary mode, with orjson if it is installed and the stdlib json otherwise
+    Args:
+      file: IO[bytes]: file opened in "rb" mode
+
+    Returns: the parsed content
+
+    """
+    if is_orjson_available():
+        import orjson
+
+        return orjson.loads(file.read())
+    return json.load(file)
+
+
 # Used in tests
 
 
@@ -30,6 +30,12 @@ class MetricStatsDict(defaultdict):
             result[key] += item
         return result
 
+    def __iadd__(self, other):
+        # merge in place instead of rebuilding a new dict with every key on each accumulation
+        for key, item in other.items():
+            self[key] += item
+        return self
+
     def topk(self, k=20):
         """
 
@@ -39,7 +45,7 @@ class MetricStatsDict(defaultdict):
         Returns:
 
         """
-        return MetricStatsDict(init={s: self.get(s) for s in heapq.nlargest(k, self, key=lambda s: self.get(s).total)})
+        return MetricStatsDict(init=heapq.nlargest(k, self.items(), key=lambda item: item[1].total))
 
     def __repr__(self):
         return ", ".join(f"{key}: {stats}" for key, stats in self.items())
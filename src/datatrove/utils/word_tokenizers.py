@@ -0,0 +1,24 @@
+from functools import lru_cache
+
+
+def word_tokenize(text: str, language: str = "english") -> tuple[str, ...]:
+    """
+        nltk's word_tokenize with a small cache on the input text.
+        Documents flow through the pipeline one at a time, so consecutive filters (for example GopherRepetitionFilter
+        followed by GopherQualityFilter) tokenize the very same text: only the first one pays for the tokenization.
+    Args:
+        text: the text to tokenize
+        language: the language of the nltk punkt model
+
+    Returns: a tuple of words, so that the cached result can not be modified by the caller
+
+    """
+    # lru_cache keys positional and keyword arguments differently: always call the cached function positionally
+    return _word_tokenize(text, language)
+
+
+@lru_cache(maxsize=2)
+def _word_tokenize(text: str, language: str) -> tuple[str, ...]:
+    from nltk.tokenize import word_tokenize as nltk_word_tokenize
+
+    return tuple(nltk_word_tokenize(text, language=language))
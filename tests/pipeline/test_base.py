@@ -1,5 +1,6 @@
 from unittest import TestCase
 
+from datatrove.data import Document
 from datatrove.pipeline.base import PipelineStep
 
 
@@ -11,6 +12,11 @@ class DummyPipelineStep(PipelineStep):
     ]
 
 
+class NoopPipelineStep(PipelineStep):
+    def run(self, data, rank: int = 0, world_size: int = 1):
+        yield from data
+
+
 class TestPipelineStep(TestCase):
     def test_init_pipeline_step_with_missing_dependencies(self):
         with self.assertRaisesRegex(
@@ -18,3 +24,15 @@ class TestPipelineStep(TestCase):
             "`non_existent_dependency1` and `non_existent_dependency2`.*`pip install non_existent_dependency1 non_existent_dependency2-wheel`",
         ):
             DummyPipelineStep()
+
+    def test_update_doc_stats(self):
+        step = NoopPipelineStep()
+        for i, doc_len in enumerate((10, 20, 30)):
+            step.update_doc_stats(Document(text="x" * doc_len, id=str(i)))
+        doc_len_stats = step.stats["doc_len"]
+        self.assertEqual(doc_len_stats.n, 3)
+        self.assertEqual(doc_len_stats.total, 60)
+        self.assertEqual(doc_len_stats.mean, 20)
+        self.assertEqual(doc_len_stats.unit, "doc")
+        # no token_count in the metadata
+        self.assertNotIn("doc_len_tokens", step.stats.stats)
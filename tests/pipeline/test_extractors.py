@@ -1,6 +1,10 @@
+import time
 import unittest
+from unittest.mock import patch
 
+from datatrove.data import Document
 from datatrove.pipeline.extractors import ReadabilityInscriptis, Trafilatura
+from datatrove.pipeline.extractors.base import BaseExtractor
 
 from ..utils import require_inscriptis, require_readability, require_trafilatura
 
@@ -8,6 +12,15 @@ from ..utils import require_inscriptis, require_readability, require_trafilatura
 ARTICLE_HTML = "<html><body><article><p>Hello World!</p></article></body></html>"
 
 
+class SlowExtractor(BaseExtractor):
+    def __init__(self, timeout: float = 0.01):
+        super().__init__(timeout)
+
+    def extract(self, text: str) -> str:
+        time.sleep(0.05)
+        return text
+
+
 class TestExtractors(unittest.TestCase):
     @require_trafilatura
     def test_basic_article_trafilatura(self):
@@ -19,3 +32,12 @@ class TestExtractors(unittest.TestCase):
     def test_basic_article_readability(self):
         extractor = ReadabilityInscriptis(min_text_length=10, min_text_score=1)
         self.assertEqual(extractor.extract(ARTICLE_HTML), "Hello World!")
+
+    def test_timeout(self):
+        extractor = SlowExtractor()
+        docs = [Document(text=ARTICLE_HTML, id=str(i)) for i in range(3)]
+        with patch("datatrove.pipeline.extractors.base.logger") as logger:
+            self.assertEqual(list(extractor.run(docs)), [])
+        self.assertEqual(extractor.stats["timeout"].total, 3)
+        self.assertEqual(extractor.stats["dropped"].total, 3)
+        logger.warning.assert_called_once()
@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 
 from datatrove.data import Document
 from datatrove.pipeline.filters import (
@@ -6,10 +7,12 @@ from datatrove.pipeline.filters import (
     GopherRepetitionFilter,
     LambdaFilter,
     LanguageFilter,
+    ListFilter,
     RegexFilter,
     UnigramLogProbFilter,
     URLFilter,
 )
+from datatrove.utils.word_tokenizers import _word_tokenize
 
 from ..utils import require_fasttext, require_nltk, require_tldextract
 
@@ -61,6 +64,19 @@ class TestFilters(unittest.TestCase):
         self.check_filter(gopher_repetition, doc, "top_3_gram")
         doc = get_doc("I am a solo traveller " * 4 + TEXT_LF_1)
         self.check_filter(gopher_repetition, doc, "duplicated_5_n_grams")
+        # nothing is repeated in an empty document
+        self.assertTrue(gopher_repetition.filter(get_doc("")))
+
+    @require_nltk
+    def test_gopher_filters_share_tokenization(self):
+        import nltk.tokenize
+
+        _word_tokenize.cache_clear()
+        with patch("nltk.tokenize.word_tokenize", wraps=nltk.tokenize.word_tokenize) as nltk_word_tokenize:
+            doc = get_doc(TEXT_LF_1)
+            GopherRepetitionFilter().filter(doc)
+            GopherQualityFilter().filter(doc)
+        nltk_word_tokenize.assert_called_once()
 
     def test_gopher_quality(self):
         gopher_quality = GopherQualityFilter(min_doc_words=10, max_doc_words=1000)
@@ -73,6 +89,38 @@ class TestFilters(unittest.TestCase):
         self.check_filter(gopher_quality, get_doc(text), "gopher_below_alpha_threshold")
         self.assertTrue(gopher_quality(get_doc(TEXT_LF_1)))
 
+    @require_nltk
+    def test_gopher_quality_alpha_words(self):
+        # numeric symbols (superscripts, fractions, circled/roman numerals) are not alphabetic
+        gopher_quality = GopherQualityFilter(
+            min_doc_words=None,
+            max_doc_words=None,
+            min_avg_word_length=None,
+            max_avg_word_length=None,
+            max_symbol_word_ratio=None,
+            max_bullet_lines_ratio=None,
+            max_ellipsis_lines_ratio=None,
+            min_stop_words=None,
+        )
+        self.check_filter(gopher_quality, get_doc("the ½ ² ① Ⅻ have"), "gopher_below_alpha_threshold")
+        self.assertTrue(gopher_quality.filter(get_doc("the apple ½ have orange")))
+
+    @require_nltk
+    def test_gopher_quality_no_words(self):
+        # documents without any non punctuation word are rejected even if there is no min_doc_words
+        gopher_quality = GopherQualityFilter(min_doc_words=None)
+        self.check_filter(gopher_quality, get_doc(""), "gopher_short_doc")
+        self.check_filter(gopher_quality, get_doc("! ? , ."), "gopher_short_doc")
+
+    @require_nltk
+    def test_list(self):
+        list_filter = ListFilter()
+        self.check_filter(list_filter, get_doc("one\ntwo\nthree\nfour"), "Suspected list")
+        self.assertTrue(list_filter.filter(get_doc(TEXT_LF_1)))
+        # no words to compare the number of lines to
+        self.assertTrue(list_filter.filter(get_doc("")))
+        self.assertTrue(list_filter.filter(get_doc("\n\n")))
+
     def test_lambda(self):
         doc = Document(text=TEXT_LF_1, id="0", metadata={"test": 1})
         lambda_filter = LambdaFilter(filter_function=lambda doc: doc.metadata["test"] > 0)
@@ -0,0 +1,81 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from datatrove.data import Document
+from datatrove.pipeline.stats import URLStats
+
+from ..utils import require_orjson, require_tldextract
+
+
+def totals(counter: dict) -> dict:
+    # MetricStats.to_dict() collapses to a plain number when only the total is meaningful
+    return {key: value["total"] if isinstance(value, dict) else value for key, value in counter.items()}
+
+
+def get_docs(rank: int) -> list[Document]:
+    return [
+        Document(text="x", id=str(i), metadata={"url": f"https://a{i % 3}.example.com/p", "token_count": i + 1})
+        for i in range(10 * (rank + 1))
+    ]
+
+
+@require_tldextract
+class TestURLStats(unittest.TestCase):
+    def setUp(self):
+        # Create a temporary directory
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+
+    def run_map_reduce(self, map_orjson: bool, reduce_orjson: bool) -> dict:
+        map_folder = os.path.join(self.tmp_dir, f"map_{map_orjson}_{reduce_orjson}")
+        reduce_folder = os.path.join(self.tmp_dir, f"reduce_{map_orjson}_{reduce_orjson}")
+        with patch("datatrove.pipeline.stats.urls.is_orjson_available", return_value=map_orjson):
+            for rank in range(3):
+                list(URLStats(map_folder)(iter(get_docs(rank)), rank=rank))
+        with patch("datatrove.utils._import_utils.is_orjson_available", return_value=reduce_orjson):
+            # 3 files with a window of 2 * read_workers = 2: results are also yielded while files are still submitted
+            list(URLStats(reduce_folder, input_folder=map_folder, read_workers=1)(None))
+        with open(os.path.join(reduce_folder, "url_stats.json")) as f:
+            return json.load(f)
+
+    def check_url_stats(self, url_stats: dict):
+        self.assertEqual(url_stats["total_docs"], 60)
+        # token counts are 1..10, 1..20 and 1..30
+        self.assertEqual(url_stats["total_tokens"], 55 + 210 + 465)
+        self.assertEqual(
+            totals(url_stats["doc_counter"]), {"a0.example.com": 21, "a1.example.com": 20, "a2.example.com": 19}
+        )
+        self.assertEqual(sum(totals(url_stats["tokens_counter"]).values()), 730)
+
+    def test_map_reduce_json(self):
+        self.check_url_stats(self.run_map_reduce(map_orjson=False, reduce_orjson=False))
+
+    @require_orjson
+    def test_map_reduce_orjson(self):
+        for map_orjson, reduce_orjson in ((True, True), (True, False), (False, True)):
+            with self.subTest(map_orjson=map_orjson, reduce_orjson=reduce_orjson):
+                self.check_url_stats(self.run_map_reduce(map_orjson, reduce_orjson))
+
+    def test_max_urls_in_memory(self):
+        # a0 is by far the most frequent domain, the other ones only show up a few times each
+        docs = [
+            Document(
+                text="x",
+                id=str(i),
+                metadata={"url": f"https://a{0 if i % 2 else i % 10}.example.com/p", "token_count": 1},
+            )
+            for i in range(100)
+        ]
+        url_stats = URLStats(self.tmp_dir, max_urls_in_memory=2)
+        list(url_stats(iter(docs)))
+        with open(os.path.join(self.tmp_dir, "00000_url_stats.json")) as f:
+            output = json.load(f)
+        self.assertLessEqual(len(output["doc_counter"]), 2 * 2)
+        self.assertIn("a0.example.com", output["doc_counter"])
+        # tokens are pruned together with the document counts
+        self.assertEqual(output["doc_counter"].keys(), output["tokens_counter"].keys())
+        self.assertEqual(totals(output["doc_counter"]), totals(output["tokens_counter"]))
@@ -0,0 +1,57 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from datatrove.tools.merge_stats import main
+from datatrove.utils.stats import PipelineStats, Stats
+
+from .utils import require_orjson
+
+
+class TestMergeStats(unittest.TestCase):
+    def setUp(self):
+        # Create a temporary directory
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        os.makedirs(os.path.join(self.tmp_dir, "stats"))
+        for rank in range(3):
+            stats = Stats("step")
+            for _ in range(rank + 1):
+                stats["documents"].update(1)
+            for doc_len in (10, 20, 30):
+                stats["doc_len"].update(doc_len)
+            with open(os.path.join(self.tmp_dir, "stats", f"{rank:05d}.json"), "w") as f:
+                PipelineStats([stats]).save_to_disk(f)
+
+    def merge(self, use_orjson: bool) -> list:
+        output = os.path.join(self.tmp_dir, f"merged_{use_orjson}.json")
+        with (
+            patch("datatrove.utils._import_utils.is_orjson_available", return_value=use_orjson),
+            patch.object(sys, "argv", ["merge_stats", os.path.join(self.tmp_dir, "stats"), "-o", output]),
+        ):
+            main()
+        with open(output) as f:
+            return json.load(f)
+
+    def check_merged(self, merged: list):
+        self.assertEqual(len(merged), 1)
+        self.assertEqual(merged[0]["name"], "step")
+        self.assertEqual(merged[0]["stats"]["documents"]["total"], 6)
+        doc_len = merged[0]["stats"]["doc_len"]
+        self.assertEqual(doc_len["total"], 180)
+        self.assertEqual(doc_len["n"], 9)
+        self.assertAlmostEqual(doc_len["mean"], 20)
+        self.assertEqual((doc_len["min"], doc_len["max"]), (10, 30))
+
+    def test_merge_stats_json(self):
+        self.check_merged(self.merge(use_orjson=False))
+
+    @require_orjson
+    def test_merge_stats_orjson(self):
+        merged = self.merge(use_orjson=True)
+        self.check_merged(merged)
+        self.assertEqual(merged, self.merge(use_orjson=False))
@@ -65,6 +65,14 @@ def require_tldextract(test_case):
     return test_case
 
 
+def require_orjson(test_case):
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        test_case = unittest.skip("test requires orjson")(test_case)
+    return test_case
+
+
 def require_boto3(test_case):
     try:
         import boto3  # noqa: F401